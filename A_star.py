@@ -17,12 +17,13 @@ Run:
 
 from __future__ import annotations
 
-import heapq
-import random
+import queue
+import threading
 import time
-from array import array
-from collections import deque
-from typing import Dict, Iterable, List, Optional, Tuple
+from itertools import permutations
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
 
 try:
     import tkinter as tk
@@ -31,6 +32,25 @@ try:
 except Exception as e:  # pragma: no cover - for environments without Tk
     raise
 
+try:
+    from numba import njit, types
+    from numba.experimental import jitclass
+    _HEAP_SPEC = [("keys", types.int64[:]), ("size", types.int64)]
+except ImportError:  # pragma: no cover - numba is optional, fall back to plain Python
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+    def jitclass(spec):  # type: ignore[no-redef]
+        return lambda cls: cls
+
+    _HEAP_SPEC = []
+
+# Compiled functions release the GIL and use NumPy's integer error model, which
+# drops the divide-by-zero branch Numba otherwise emits for every `//`.
+JIT_OPTIONS = dict(cache=True, nogil=True, error_model="numpy")
+
 
 # Direction bit flags for cell walls
 N, S, E, W = 1, 2, 4, 8
@@ -41,44 +61,76 @@ DIRS: Dict[int, Tuple[int, int]] = {
     W: (0, -1),
 }
 OPPOSITE = {N: S, S: N, E: W, W: E}
-
-
-def generate_maze(rows: int, cols: int) -> Tuple[List[List[int]], Tuple[int, int], Tuple[int, int]]:
+# All 24 orderings of the four directions; maze generation draws one per step
+DIR_ORDERS: Tuple[Tuple[int, ...], ...] = tuple(permutations(DIRS))
+
+# Open-heap entries are single int64 keys: f in the high bits, then h, then
+# the cell index (21 bits each, so mazes up to 2M cells). Among equal f,
+# smaller h means larger g, so deeper cells that are closer to the goal pop
+# first; remaining ties go by cell index.
+KEY_F_SHIFT = 42
+KEY_H_SHIFT = 21
+KEY_IDX_MASK = (1 << KEY_H_SHIFT) - 1
+
+# Event codes recorded by the search core and replayed by the animator.
+# Bidirectional search tags reverse-side events by adding EV_REVERSE.
+EV_OPEN, EV_CLOSED, EV_BRANCH, EV_CURRENT = 0, 1, 2, 3
+EV_REVERSE = 4
+EVENT_NAMES = (
+    "open_add", "closed_add", "branch", "current",
+    "open_add_rev", "closed_add_rev", "branch_rev", "current_rev",
+)
+
+
+def generate_maze(rows: int, cols: int) -> Tuple[bytearray, Tuple[int, int], Tuple[int, int]]:
     """Generate a perfect maze with iterative recursive-backtracker (DFS).
 
     Cell stores bitflags of walls present (N|S|E|W). Removing a wall clears bit.
+    Cells are packed row-major into one flat array: cell (r, c) is ``walls[r * cols + c]``.
     """
     if rows <= 0 or cols <= 0:
         raise ValueError("rows and cols must be positive")
 
-    grid = [[N | S | E | W for _ in range(cols)] for _ in range(rows)]
-    visited = [[False] * cols for _ in range(rows)]
+    total = rows * cols
+    walls = bytearray([N | S | E | W]) * total
+    visited = bytearray(total)
+
+    stack: List[int] = [0]
+    visited[0] = 1
 
-    stack: List[Tuple[int, int]] = [(0, 0)]
-    visited[0][0] = True
+    # Random direction orders are drawn in bulk; taking the first unvisited
+    # neighbor in a uniformly random order is a uniform pick among candidates.
+    pool_size = 2 * total
+    pool: List[int] = []
+    k = pool_size
 
     while stack:
-        r, c = stack[-1]
-        candidates: List[Tuple[int, int, int]] = []
-        for d, (dr, dc) in DIRS.items():
-            nr, nc = r + dr, c + dc
-            if 0 <= nr < rows and 0 <= nc < cols and not visited[nr][nc]:
-                candidates.append((d, nr, nc))
-        if candidates:
-            d, nr, nc = random.choice(candidates)
-            grid[r][c] &= ~d
-            grid[nr][nc] &= ~OPPOSITE[d]
-            visited[nr][nc] = True
-            stack.append((nr, nc))
+        i = stack[-1]
+        r, c = divmod(i, cols)
+        if k == pool_size:
+            pool = np.random.randint(0, len(DIR_ORDERS), size=pool_size).tolist()
+            k = 0
+        order = DIR_ORDERS[pool[k]]
+        k += 1
+        for d in order:
+            dr, dc = DIRS[d]
+            if not (0 <= r + dr < rows and 0 <= c + dc < cols):
+                continue
+            ni = i + dr * cols + dc
+            if not visited[ni]:
+                walls[i] &= ~d
+                walls[ni] &= ~OPPOSITE[d]
+                visited[ni] = 1
+                stack.append(ni)
+                break
         else:
             stack.pop()
 
-    return grid, (0, 0), (rows - 1, cols - 1)
+    return walls, (0, 0), (rows - 1, cols - 1)
 
 
-def _neighbors(grid: List[List[int]], r: int, c: int) -> Iterable[Tuple[int, int]]:
-    rows, cols = len(grid), len(grid[0])
-    cell = grid[r][c]
+def _neighbors(walls: bytearray, rows: int, cols: int, r: int, c: int) -> Iterator[Tuple[int, int]]:
+    cell = walls[r * cols + c]
     if c + 1 < cols and not (cell & E):
         yield r, c + 1
     if c - 1 >= 0 and not (cell & W):
@@ -89,16 +141,472 @@ def _neighbors(grid: List[List[int]], r: int, c: int) -> Iterable[Tuple[int, int
         yield r - 1, c
 
 
-def _reconstruct_path_idx(prev: array, end_idx: int, cols: int) -> List[Tuple[int, int]]:
+def _reconstruct_path_idx(prev: np.ndarray, end_idx: int, cols: int) -> List[Tuple[int, int]]:
     path_idx: List[int] = []
     cur = end_idx
     while cur != -1:
         path_idx.append(cur)
-        cur = prev[cur]
+        cur = int(prev[cur])
     path_idx.reverse()
     return [(i // cols, i % cols) for i in path_idx]
 
 
+@jitclass(_HEAP_SPEC)
+class NaryHeap:
+    """4-ary min-heap of int64 keys over a caller-provided buffer.
+
+    Four children per node halve the tree depth compared to a binary heap and
+    keep each sift-down comparison on one contiguous run of keys. Callers pack
+    their payload into the key itself (see :func:`heap_key`). The heap starts
+    empty and only borrows ``keys``, so the buffer can outlive it and be reused.
+    """
+
+    def __init__(self, keys: np.ndarray) -> None:
+        self.keys = keys
+        self.size = 0
+
+    def push(self, key: int) -> None:
+        keys = self.keys
+        i = self.size
+        self.size += 1
+        while i > 0:
+            parent = (i - 1) >> 2
+            if keys[parent] <= key:
+                break
+            keys[i] = keys[parent]
+            i = parent
+        keys[i] = key
+
+    def peek(self) -> int:
+        return self.keys[0]
+
+    def pop(self) -> int:
+        keys = self.keys
+        top = keys[0]
+        self.size -= 1
+        n = self.size
+        if n > 0:
+            key = keys[n]
+            i = 0
+            while True:
+                first_child = (i << 2) + 1
+                if first_child >= n:
+                    break
+                best = first_child
+                best_key = keys[first_child]
+                for ch in range(first_child + 1, min(first_child + 4, n)):
+                    if keys[ch] < best_key:
+                        best = ch
+                        best_key = keys[ch]
+                if best_key >= key:
+                    break
+                keys[i] = best_key
+                i = best
+            keys[i] = key
+        return top
+
+
+@njit(**JIT_OPTIONS)
+def heap_key(f: int, h: int, i: int) -> int:
+    return np.int64(f) << KEY_F_SHIFT | np.int64(h) << KEY_H_SHIFT | i
+
+
+@njit(**JIT_OPTIONS)
+def build_adjacency(walls: np.ndarray, rows: int, cols: int) -> np.ndarray:
+    """Precompute open neighbors per cell as a ``(rows * cols, 4)`` table.
+
+    Columns follow E, W, S, N order; ``-1`` marks a wall or the maze border.
+    """
+    adj = np.full((rows * cols, 4), -1, np.int32)
+    i = 0
+    for r in range(rows):
+        for c in range(cols):
+            cell = walls[i]
+            if c + 1 < cols and not (cell & E):
+                adj[i, 0] = i + 1
+            if c - 1 >= 0 and not (cell & W):
+                adj[i, 1] = i - 1
+            if r + 1 < rows and not (cell & S):
+                adj[i, 2] = i + cols
+            if r - 1 >= 0 and not (cell & N):
+                adj[i, 3] = i - cols
+            i += 1
+    return adj
+
+
+@njit(**JIT_OPTIONS)
+def build_corridor_graph(adj: np.ndarray, start_i: int, end_i: int):
+    """Collapse corridors into weighted jumps between key cells.
+
+    Key cells are junctions, dead ends, start and end: everything except cells
+    with exactly two exits. Returns ``(jump_to, jump_len, cell_off, cells)``:
+    for a key cell ``i`` and direction slot ``k`` (same order as ``adj``),
+    ``jump_to[i, k]`` is the next key cell along that corridor, ``jump_len[i, k]``
+    its distance in steps, and ``cells[cell_off[i, k]:cell_off[i, k] + jump_len[i, k] - 1]``
+    the corridor cells walked in between, nearest first.
+    """
+    total = adj.shape[0]
+    is_key = np.zeros(total, np.uint8)
+    for i in range(total):
+        deg = 0
+        for k in range(4):
+            if adj[i, k] >= 0:
+                deg += 1
+        if deg != 2:
+            is_key[i] = 1
+    is_key[start_i] = 1
+    is_key[end_i] = 1
+
+    jump_to = np.full((total, 4), -1, np.int32)
+    jump_len = np.zeros((total, 4), np.int32)
+    cell_off = np.zeros((total, 4), np.int32)
+    # Every corridor is walked once from each end
+    cells = np.empty(2 * total, np.int32)
+    n_cells = 0
+    for i in range(total):
+        if not is_key[i]:
+            continue
+        for k in range(4):
+            cur = adj[i, k]
+            if cur < 0:
+                continue
+            cell_off[i, k] = n_cells
+            before = i
+            length = 1
+            while not is_key[cur]:
+                cells[n_cells] = cur
+                n_cells += 1
+                # Leave through the exit we did not come in by
+                nxt = -1
+                for kk in range(4):
+                    if adj[cur, kk] >= 0 and adj[cur, kk] != before:
+                        nxt = adj[cur, kk]
+                        break
+                before = cur
+                cur = nxt
+                length += 1
+            jump_to[i, k] = cur
+            jump_len[i, k] = length
+    return jump_to, jump_len, cell_off, cells[:n_cells]
+
+
+@njit(**JIT_OPTIONS)
+def _link_forward(path_prev: np.ndarray, prev: np.ndarray, prev_slot: np.ndarray, graph, v: int) -> None:
+    """Fill cell-level parents from key cell ``v`` back to the search root."""
+    _, jump_len, cell_off, cells = graph
+    while prev[v] != -1:
+        u = prev[v]
+        k = prev_slot[v]
+        last = u
+        off = cell_off[u, k]
+        for j in range(off, off + jump_len[u, k] - 1):
+            path_prev[cells[j]] = last
+            last = cells[j]
+        path_prev[v] = last
+        v = u
+
+
+def alloc_workspace(total: int):
+    """Allocate the search buffers shared by both A* cores for ``total`` cells.
+
+    Per-cell arrays have one row per search direction (the one-sided core uses
+    row 0). The cores reset whatever they use, so a workspace is allocated once
+    per maze size and reused for every solve. Everything is a plain ndarray so
+    the cores' signatures stay cacheable across processes.
+    """
+    return (
+        np.empty((2, total), np.int32),  # g
+        np.empty((2, total), np.int32),  # prev (jump parents)
+        np.empty((2, total), np.uint8),  # prev_slot
+        np.empty((2, total), np.int32),  # h_cache
+        np.empty((2, total), np.int32),  # best_f
+        np.empty((2, total), np.uint8),  # in_open
+        np.empty(total, np.uint8),       # closed / settled
+        np.empty(8 * total, np.int32),   # event order
+        np.empty(8 * total, np.int32),   # event kind
+        # Open-heap key buffers; a cell may be re-pushed whenever its g
+        # improves, at most once per incoming jump
+        np.empty((2, 4 * total + 1), np.int64),
+    )
+
+
+@njit(**JIT_OPTIONS)
+def astar_core(graph, work, cols: int, start_i: int, end_i: int):
+    """Run A* over the corridor graph from :func:`build_corridor_graph` and record the exploration order.
+
+    Only key cells enter the heap; each jump costs its corridor length, which
+    never undercuts the Manhattan distance, so the heuristic stays consistent.
+    ``work`` comes from :func:`alloc_workspace`. Returns
+    ``(prev, expansions, order, kind)`` where ``prev`` holds cell-level parents
+    along the found path and ``order``/``kind`` hold the visited cell index and
+    event code (``EV_*``) for each visualization step; ``order``/``kind`` are
+    views into ``work`` and are overwritten by the next solve.
+    """
+    jump_to, jump_len, cell_off, cells = graph
+    total = jump_to.shape[0]
+    g_all, prev_all, slot_all, h_all, best_all, open_all, closed, order, kind, heap_keys = work
+    g = g_all[0]
+    g.fill(1 << 30)
+    prev = prev_all[0]
+    prev.fill(-1)
+    prev_slot = slot_all[0]  # jump slot in prev[i] that reached i
+    h_cache = h_all[0]  # lazily memoized Manhattan distance to end
+    h_cache.fill(-1)
+    best_f = best_all[0]  # f of the newest heap entry per cell
+    best_f.fill(1 << 30)
+    in_open = open_all[0]
+    in_open.fill(0)
+    closed.fill(0)
+    open_heap = NaryHeap(heap_keys[0])
+    n_ev = 0
+
+    er = end_i // cols
+    ec = end_i - er * cols
+    sr = start_i // cols
+    sc = start_i - sr * cols
+
+    g[start_i] = 0
+    h_cache[start_i] = abs(sr - er) + abs(sc - ec)
+    in_open[start_i] = 1
+    h0 = h_cache[start_i]
+    best_f[start_i] = h0
+    open_heap.push(heap_key(h0, h0, start_i))
+    order[n_ev] = start_i
+    kind[n_ev] = EV_OPEN
+    n_ev += 1
+
+    expansions = 0
+    while open_heap.size > 0:
+        key = open_heap.pop()
+        i = key & KEY_IDX_MASK
+        if key >> KEY_F_SHIFT > best_f[i]:
+            continue  # skip entries superseded by a later, better push
+        order[n_ev] = i
+        kind[n_ev] = EV_CURRENT
+        n_ev += 1
+
+        if i == end_i:
+            break
+
+        closed[i] = 1
+
+        exits = 0
+        reached_end = False
+
+        # Jump along each corridor leaving i: E, W, S, N
+        for k in range(4):
+            ni = jump_to[i, k]
+            if ni < 0:
+                continue
+            exits += 1
+            tentative = g[i] + jump_len[i, k]
+            if tentative < g[ni]:
+                # Corridor jumps have unequal lengths, so a cell already in open
+                # can still improve; push a new entry and let the outdated one
+                # be ignored when popped due to the 'best_f' check above.
+                g[ni] = tentative
+                prev[ni] = i
+                prev_slot[ni] = k
+                if ni == end_i:
+                    reached_end = True
+                hv = h_cache[ni]
+                if hv < 0:
+                    nr = ni // cols
+                    hv = abs(nr - er) + abs(ni - nr * cols - ec)
+                    h_cache[ni] = hv
+                best_f[ni] = tentative + hv
+                open_heap.push(heap_key(tentative + hv, hv, ni))
+                if not in_open[ni]:
+                    in_open[ni] = 1
+                    order[n_ev] = ni
+                    kind[n_ev] = EV_OPEN
+                    n_ev += 1
+
+        # Corridors walked towards cells that are not yet closed count as explored
+        for k in range(4):
+            ni = jump_to[i, k]
+            if ni < 0 or closed[ni]:
+                continue
+            off = cell_off[i, k]
+            for j in range(off, off + jump_len[i, k] - 1):
+                order[n_ev] = cells[j]
+                kind[n_ev] = EV_CLOSED
+                n_ev += 1
+
+        expansions += 1
+
+        # Mark intersections (>=3 exits) differently from corridors
+        order[n_ev] = i
+        kind[n_ev] = EV_BRANCH if exits >= 3 else EV_CLOSED
+        n_ev += 1
+
+        # No open entry has a smaller f than the heap top, so once the goal's
+        # new g is within that bound it is final: finish without popping it.
+        if reached_end and g[end_i] <= open_heap.peek() >> KEY_F_SHIFT:
+            break
+
+    path_prev = np.full(total, -1, np.int32)
+    _link_forward(path_prev, prev, prev_slot, graph, end_i)
+    return path_prev, expansions, order[:n_ev], kind[:n_ev]
+
+
+@njit(**JIT_OPTIONS)
+def astar_bidir_core(graph, work, cols: int, start_i: int, end_i: int):
+    """Bidirectional A* (NBA*): search forward from start and backward from end.
+
+    Each iteration expands the side with the smaller open set. The best meeting
+    cell ``meet`` (minimizing ``g_fwd + g_rev``) is tracked on every relax, and
+    popped cells that provably cannot improve on it are settled without being
+    expanded, so the two frontiers do not run past each other. Returns the same
+    tuple as :func:`astar_core`, with ``prev`` already stitched into one
+    start->end chain and reverse-side events tagged with ``EV_REVERSE``.
+    """
+    jump_to, jump_len, cell_off, cells = graph
+    total = jump_to.shape[0]
+    inf = 1 << 30
+    # Row 0 holds forward-search state, row 1 reverse-search state
+    g, prev, prev_slot, h_cache, best_f, in_open, settled, order, kind, heap_keys = work
+    g.fill(inf)
+    prev.fill(-1)
+    h_cache.fill(-1)
+    best_f.fill(inf)
+    in_open.fill(0)
+    settled.fill(0)  # shared by both sides
+    fwd = NaryHeap(heap_keys[0])
+    rev = NaryHeap(heap_keys[1])
+    n_ev = 0
+
+    sr = start_i // cols
+    sc = start_i - sr * cols
+    er = end_i // cols
+    ec = end_i - er * cols
+    # Each side steers towards the other side's root
+    target_r = (er, sr)
+    target_c = (ec, sc)
+
+    for side in range(2):
+        root = start_i if side == 0 else end_i
+        g[side, root] = 0
+        h_cache[side, root] = abs(sr - er) + abs(sc - ec)
+        h_cache[1 - side, root] = 0
+        in_open[side, root] = 1
+        heap = fwd if side == 0 else rev
+        h0 = h_cache[side, root]
+        best_f[side, root] = h0
+        heap.push(heap_key(h0, h0, root))
+        order[n_ev] = root
+        kind[n_ev] = EV_OPEN + side * EV_REVERSE
+        n_ev += 1
+
+    mu = inf
+    meet = -1
+    if start_i == end_i:
+        mu = 0
+        meet = start_i
+
+    expansions = 0
+    while fwd.size > 0 and rev.size > 0:
+        top_f = fwd.peek() >> KEY_F_SHIFT
+        top_r = rev.peek() >> KEY_F_SHIFT
+        if max(top_f, top_r) >= mu:
+            break  # neither frontier can still beat the best meeting point
+        side = 0 if fwd.size <= rev.size else 1  # grow the smaller frontier
+        other = 1 - side
+        heap = fwd if side == 0 else rev
+        top_other = top_r if side == 0 else top_f
+        key = heap.pop()
+        i = key & KEY_IDX_MASK
+        if key >> KEY_F_SHIFT > best_f[side, i]:
+            continue  # skip entries superseded by a later, better push
+        if settled[i]:
+            continue  # already settled by either side
+        settled[i] = 1
+
+        gi = g[side, i]
+        # Prune: any path through i costs at least gi + h(i), and also at least
+        # gi + (best f on the other side) - (heuristic from i back to our root)
+        if gi + h_cache[side, i] >= mu or gi + top_other - h_cache[other, i] >= mu:
+            continue
+
+        tag = side * EV_REVERSE
+        order[n_ev] = i
+        kind[n_ev] = EV_CURRENT + tag
+        n_ev += 1
+
+        exits = 0
+        tr = target_r[side]
+        tc = target_c[side]
+
+        # Jump along each corridor leaving i: E, W, S, N
+        for k in range(4):
+            ni = jump_to[i, k]
+            if ni < 0:
+                continue
+            exits += 1
+            tentative = gi + jump_len[i, k]
+            if settled[ni] or tentative >= g[side, ni]:
+                continue
+            g[side, ni] = tentative
+            prev[side, ni] = i
+            prev_slot[side, ni] = k
+            hv = h_cache[side, ni]
+            if hv < 0:
+                # One division fills both directions' heuristics, so the
+                # pruning test never needs this cell's row/column again
+                nr = ni // cols
+                nc = ni - nr * cols
+                hv = abs(nr - tr) + abs(nc - tc)
+                h_cache[side, ni] = hv
+                h_cache[other, ni] = abs(nr - target_r[other]) + abs(nc - target_c[other])
+            best_f[side, ni] = tentative + hv
+            heap.push(heap_key(tentative + hv, hv, ni))
+            if g[other, ni] < inf and tentative + g[other, ni] < mu:
+                mu = tentative + g[other, ni]
+                meet = ni
+            if not in_open[side, ni]:
+                in_open[side, ni] = 1
+                order[n_ev] = ni
+                kind[n_ev] = EV_OPEN + tag
+                n_ev += 1
+
+        # Corridors walked towards unsettled cells count as explored
+        for k in range(4):
+            ni = jump_to[i, k]
+            if ni < 0 or settled[ni]:
+                continue
+            off = cell_off[i, k]
+            for j in range(off, off + jump_len[i, k] - 1):
+                order[n_ev] = cells[j]
+                kind[n_ev] = EV_CLOSED + tag
+                n_ev += 1
+
+        expansions += 1
+
+        order[n_ev] = i
+        kind[n_ev] = (EV_BRANCH if exits >= 3 else EV_CLOSED) + tag
+        n_ev += 1
+
+    path_prev = np.full(total, -1, np.int32)
+    if meet >= 0:
+        _link_forward(path_prev, prev[0], prev_slot[0], graph, meet)
+        # Reverse half: each jump x -> v was walked from x, so link it back to front
+        v = meet
+        while prev[1, v] != -1:
+            x = prev[1, v]
+            k = prev_slot[1, v]
+            last = v
+            off = cell_off[x, k]
+            for j in range(off + jump_len[x, k] - 2, off - 1, -1):
+                path_prev[cells[j]] = last
+                last = cells[j]
+            path_prev[x] = last
+            v = x
+    else:
+        _link_forward(path_prev, prev[0], prev_slot[0], graph, end_i)
+
+    return path_prev, expansions, order[:n_ev], kind[:n_ev]
+
+
 class AStarVisualizer:
     MAX_WINDOW = 800
     PANEL_WIDTH = 260
@@ -110,6 +618,25 @@ class AStarVisualizer:
     COLOR_CURRENT = "#FF8C00"  # dark orange
     COLOR_PATH = "#FF4500"     # red
     COLOR_BRANCH = "#B39DDB"   # muted purple for intersections
+    COLOR_OPEN_REV = "#B5E6C3"    # pale green (reverse frontier)
+    COLOR_CLOSED_REV = "#D9CFC1"  # warm light gray (reverse explored)
+
+    # Fixed attribute layout: no per-instance __dict__
+    __slots__ = (
+        # Widgets and Tk variables
+        "root", "canvas_size", "canvas", "overlay",
+        "size_var", "size_scale", "speed_var", "speed_scale", "bidir_var",
+        "solve_btn", "pause_btn", "stop_btn",
+        "info_steps", "info_time", "info_status",
+        # Maze and search state
+        "walls", "rows", "cols", "graph", "start", "end",
+        "_work", "_work_lock",
+        # Drawing geometry
+        "cell_px", "offset_x", "offset_y", "_edge_x", "_edge_y", "_cell_x", "_cell_y", "_view_w", "_view_h",
+        # Animation control
+        "_running", "_paused", "_events", "_current_item", "_current_item_rev",
+        "_tick_ms", "_speed_accum", "_t0", "_cols", "_final_state",
+    )
 
     def __init__(self, root: tk.Tk) -> None:
         self.root = root
@@ -142,6 +669,8 @@ class AStarVisualizer:
         self.canvas_size = min(self.MAX_WINDOW - self.PANEL_WIDTH - 10, self.MAX_WINDOW - 10)
         self.canvas = tk.Canvas(container, width=self.canvas_size, height=self.canvas_size, bg="white")
         self.canvas.pack(side=tk.LEFT, padx=5, pady=5, fill=tk.BOTH, expand=True)
+        # Image holding the maze walls and visited-cell colors; rebuilt by _draw_maze
+        self.overlay: Optional[tk.PhotoImage] = None
 
         panel = tk.Frame(container, width=self.PANEL_WIDTH)
         panel.pack(side=tk.RIGHT, fill=tk.Y, padx=5, pady=5)
@@ -181,6 +710,9 @@ class AStarVisualizer:
         )
         self.speed_scale.pack(anchor="w")
 
+        self.bidir_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(panel, text="Bidirectional", variable=self.bidir_var).pack(anchor="w", pady=(0, 6))
+
         self.solve_btn = tk.Button(panel, text="Solve (A*)", command=self.on_solve)
         self.solve_btn.pack(fill=tk.X, pady=(0, 4))
         self.pause_btn = tk.Button(panel, text="Pause", state=tk.DISABLED, command=self.on_pause_resume)
@@ -197,18 +729,32 @@ class AStarVisualizer:
         ttk.Label(panel, textvariable=self.info_status).pack(anchor="w", pady=(4, 0))
 
         # State
-        self.grid: Optional[List[List[int]]] = None
+        self.walls: Optional[bytearray] = None
+        self.rows: int = 0
+        self.cols: int = 0
+        self.graph: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = None
+        # Search buffers reused across solves of the same size (see alloc_workspace)
+        self._work = None  # type: ignore[var-annotated]
+        self._work_lock = threading.Lock()
         self.start: Optional[Tuple[int, int]] = None
         self.end: Optional[Tuple[int, int]] = None
         self.cell_px: float = 0.0
         self.offset_x: float = 0.0
         self.offset_y: float = 0.0
+        # Integer pixel spans (start, stop) of the shrunken cell boxes per column / row
+        self._edge_x: List[int] = []
+        self._edge_y: List[int] = []
+        self._cell_x: List[Tuple[int, int]] = []
+        self._cell_y: List[Tuple[int, int]] = []
+        self._view_w: int = self.canvas_size
+        self._view_h: int = self.canvas_size
 
         # Animation control
         self._running = False
         self._paused = False
-        self._gen = None  # type: ignore[var-annotated]
+        self._events: Optional[queue.SimpleQueue] = None  # filled by the solver thread
         self._current_item: Optional[int] = None
+        self._current_item_rev: Optional[int] = None
         self._tick_ms = 16  # ~60 FPS
         self._speed_accum = 0.0
 
@@ -224,7 +770,13 @@ class AStarVisualizer:
         if n % 2:
             n -= 1
             self.size_var.set(max(2, n))
-        self.grid, self.start, self.end = generate_maze(n, n)
+        self.walls, self.start, self.end = generate_maze(n, n)
+        self.rows = self.cols = n
+        # Walls are fixed while solving, so resolve neighbors and corridors once per maze
+        adj = build_adjacency(np.frombuffer(self.walls, dtype=np.uint8), n, n)
+        self.graph = build_corridor_graph(adj, self.start[0] * n + self.start[1], self.end[0] * n + self.end[1])
+        if self._work is None or self._work[0].shape[1] != n * n:
+            self._work = alloc_workspace(n * n)
         self._prepare_draw_params(n, n)
         self._draw_maze()
         self.info_status.set("Status: running A*")
@@ -232,8 +784,16 @@ class AStarVisualizer:
         self.info_time.set("Time: - ms")
 
         # Start generator for animation
-        assert self.grid and self.start and self.end
-        self._gen = self._astar_steps(self.grid, self.start, self.end)
+        assert self.walls and self.start and self.end
+        steps = self._astar_steps_bidir if self.bidir_var.get() else self._astar_steps
+        self._cols = self.cols
+        # Solve on a worker thread; the animation drains its events each tick
+        self._events = queue.SimpleQueue()
+        threading.Thread(
+            target=self._solve_worker,
+            args=(steps(self.graph, self._work, self.cols, self.start, self.end), self._events),
+            daemon=True,
+        ).start()
         self._running = True
         self._paused = False
         self._t0 = time.perf_counter()
@@ -260,17 +820,17 @@ class AStarVisualizer:
         if self._running or self._paused:
             self._running = False
             self._paused = False
-            self._gen = None
+            self._events = None
             self.pause_btn.config(state=tk.DISABLED, text="Pause")
             self.info_status.set("Status: stopped")
         # Redraw maze to clear overlays
-        if self.grid is not None:
+        if self.walls is not None:
             self._draw_maze()
         self.info_steps.set("Steps: -")
         self.info_time.set("Time: - ms")
 
     def _animate_step(self) -> None:
-        if not self._running or self._gen is None:
+        if not self._running or self._events is None:
             return
         if self._paused:
             return
@@ -290,16 +850,44 @@ class AStarVisualizer:
             self.root.after(self._tick_ms, self._animate_step)
             return
         finished = False
+        # Bind everything the per-cell loop touches once per tick
+        events = self._events
+        cols = self._cols
+        cell_x, cell_y = self._cell_x, self._cell_y
+        put = self.overlay.put
+        draw_current = self._draw_current
+        fill_colors = {
+            "open_add": self.COLOR_OPEN,
+            "closed_add": self.COLOR_CLOSED,
+            "branch": self.COLOR_BRANCH,
+            "open_add_rev": self.COLOR_OPEN_REV,
+            "closed_add_rev": self.COLOR_CLOSED_REV,
+            "branch_rev": self.COLOR_BRANCH,
+        }
         for _ in range(max(1, steps_this_frame)):
             try:
-                action = next(self._gen)
-            except StopIteration as e:  # e.value may contain (prev, cols, end_idx)
+                kind, payload = events.get_nowait()
+            except queue.Empty:
+                break  # solver has not produced the next event yet
+            color = fill_colors.get(kind)
+            if color is not None:
+                for i in payload:  # type: ignore[attr-defined]
+                    r, c = divmod(i, cols)
+                    x0, x1 = cell_x[c]
+                    y0, y1 = cell_y[r]
+                    put(color, to=(x0, y0, x1, y1))
+            elif kind == "current":
+                draw_current(*divmod(payload, cols))
+            elif kind == "current_rev":
+                draw_current(*divmod(payload, cols), reverse=True)
+            elif kind == "finish":
+                # store final state for the block below to render path
+                self._final_state = payload
                 finished = True
                 break
-            self._apply_action(action)
         if finished:
             # Draw final path and update metrics
-            prev, cols, end_idx, expansions = self._final_state  # type: ignore[attr-defined]
+            prev, cols, end_idx, expansions = self._final_state
             path = _reconstruct_path_idx(prev, end_idx, cols)
             self._draw_final_path(path)
             t_ms = (time.perf_counter() - self._t0) * 1000.0
@@ -328,6 +916,30 @@ class AStarVisualizer:
         self.offset_x = (w - maze_w) / 2
         self.offset_y = (h - maze_h) / 2
         self.cell_px = size
+        self._view_w, self._view_h = w, h
+
+        def edges(origin: float, n: int, limit: int) -> List[int]:
+            return [min(max(0, int(round(origin + k * size))), limit - 1) for k in range(n + 1)]
+
+        # Pixel rows/columns of the wall lines between cells
+        self._edge_x = edges(self.offset_x, cols, w)
+        self._edge_y = edges(self.offset_y, rows, h)
+
+        pad = size * 0.12
+
+        def spans(origin: float, lines: List[int]) -> List[Tuple[int, int]]:
+            # Fills share the overlay with the walls, so keep each span strictly
+            # between its two wall lines
+            out = []
+            for k in range(len(lines) - 1):
+                e0, e1 = lines[k], lines[k + 1]
+                p0 = min(max(int(round(origin + k * size + pad)), e0 + 1), e1 - 1)
+                p1 = min(int(round(origin + (k + 1) * size - pad)), e1)
+                out.append((p0, max(p0 + 1, p1)))
+            return out
+
+        self._cell_x = spans(self.offset_x, self._edge_x)
+        self._cell_y = spans(self.offset_y, self._edge_y)
 
     def _clear_canvas(self) -> None:
         self.canvas.delete("all")
@@ -342,26 +954,17 @@ class AStarVisualizer:
         return x0 + dx, y0 + dy, x1 - dx, y1 - dy
 
     def _draw_maze(self) -> None:
-        if self.grid is None:
+        if self.walls is None:
             return
         self._clear_canvas()
-        rows, cols = len(self.grid), len(self.grid[0])
+        walls, rows, cols = self.walls, self.rows, self.cols
         self._prepare_draw_params(rows, cols)
-        size = self.cell_px
-        x0, y0 = self.offset_x, self.offset_y
-        x1, y1 = x0 + cols * size, y0 + rows * size
-        self.canvas.create_rectangle(x0, y0, x1, y1)
-
-        # Draw internal walls
-        for r in range(rows):
-            for c in range(cols):
-                cell = self.grid[r][c]
-                cx0, cy0 = x0 + c * size, y0 + r * size
-                cx1, cy1 = cx0 + size, cy0 + size
-                if cell & E:
-                    self.canvas.create_line(cx1, cy0, cx1, cy1)
-                if cell & S:
-                    self.canvas.create_line(cx0, cy1, cx1, cy1)
+        # Walls and border are rasterised into one opaque image; cell fills
+        # are later put() into the same image, beneath the canvas markers
+        self.overlay = tk.PhotoImage(
+            data=self._render_walls(walls, rows, cols), format="PPM"
+        )
+        self.canvas.create_image(0, 0, anchor="nw", image=self.overlay)
 
         # Start and end markers
         if self.start and self.end:
@@ -376,15 +979,50 @@ class AStarVisualizer:
         self.canvas.delete("current")
         self.canvas.delete("path")
 
-    def _fill_cell(self, r: int, c: int, color: str, tag: str) -> int:
-        x0, y0, x1, y1 = self._cell_rect(r, c)
-        return self.canvas.create_rectangle(x0, y0, x1, y1, fill=color, outline="", tags=(tag,))
-
-    def _draw_current(self, r: int, c: int) -> None:
-        if self._current_item is not None:
+    def _render_walls(self, walls: bytearray, rows: int, cols: int) -> bytes:
+        """Return the maze walls as binary PPM data covering the whole canvas.
+
+        Each wall is a 1-pixel stroke on the ``_edge_x``/``_edge_y`` lines, so
+        the image is composed with numpy in a handful of vectorised writes
+        instead of one canvas item per wall.
+        """
+        w, h = self._view_w, self._view_h
+        xs = np.array(self._edge_x, dtype=np.intp)
+        ys = np.array(self._edge_y, dtype=np.intp)
+        img = np.full((h, w, 3), 255, dtype=np.uint8)
+
+        grid = np.frombuffer(walls, dtype=np.uint8).reshape(rows, cols)
+        # Cell row/column owning each pixel row/column inside the maze
+        py = np.arange(ys[0], ys[-1] + 1)
+        px = np.arange(xs[0], xs[-1] + 1)
+        row_of = np.minimum(np.searchsorted(ys, py, side="right") - 1, rows - 1)
+        col_of = np.minimum(np.searchsorted(xs, px, side="right") - 1, cols - 1)
+
+        # East walls are vertical strokes on the cell's right edge
+        yi, ci = np.nonzero((grid & E).astype(bool)[row_of])
+        img[py[yi], xs[ci + 1]] = 0
+        # South walls are horizontal strokes on the cell's bottom edge
+        ri, xi = np.nonzero((grid & S).astype(bool)[:, col_of])
+        img[ys[ri + 1], px[xi]] = 0
+        # Outer top and left border; right and bottom come from E/S walls
+        img[ys[0], px] = 0
+        img[py, xs[0]] = 0
+
+        return b"P6 %d %d 255\n" % (w, h) + img.tobytes()
+
+    def _draw_current(self, r: int, c: int, reverse: bool = False) -> None:
+        # Each search direction keeps its own current marker
+        item = self._current_item_rev if reverse else self._current_item
+        if item is not None:
             # Turn previous current to closed color (it should already be closed though)
-            self.canvas.delete(self._current_item)
-        self._current_item = self._fill_cell(r, c, self.COLOR_CURRENT, "current")
+            self.canvas.delete(item)
+        x0, y0, x1, y1 = self._cell_rect(r, c)
+        item = self.canvas.create_rectangle(x0, y0, x1, y1, fill=self.COLOR_CURRENT, outline="",
+                                            tags=("current",))
+        if reverse:
+            self._current_item_rev = item
+        else:
+            self._current_item = item
 
     def _draw_final_path(self, path: List[Tuple[int, int]]) -> None:
         if not path:
@@ -400,124 +1038,48 @@ class AStarVisualizer:
                                 capstyle=tk.ROUND, joinstyle=tk.ROUND, tags=("path",))
 
     def _on_canvas_resize(self, event: tk.Event) -> None:  # type: ignore[name-defined]
-        if self.grid is None:
+        if self.walls is None:
             return
         self._draw_maze()
 
     # ----------------------- A* Animation -----------------------
-    def _apply_action(self, action: Tuple[str, object]) -> None:
-        kind, payload = action
-        if kind == "open_add":
-            for i in payload:  # type: ignore[assignment]
-                r, c = divmod(i, self._cols)
-                self._fill_cell(r, c, self.COLOR_OPEN, "open")
-        elif kind == "closed_add":
-            for i in payload:
-                r, c = divmod(i, self._cols)
-                self._fill_cell(r, c, self.COLOR_CLOSED, "closed")
-        elif kind == "branch":
-            for i in payload:
-                r, c = divmod(i, self._cols)
-                self._fill_cell(r, c, self.COLOR_BRANCH, "branch")
-        elif kind == "current":
-            i = payload  # type: ignore[assignment]
-            r, c = divmod(i, self._cols)
-            self._draw_current(r, c)
-        elif kind == "finish":
-            # store final state for the outer loop to render path
-            self._final_state = payload  # type: ignore[attr-defined]
-
-    def _astar_steps(self, grid: List[List[int]], start: Tuple[int, int], end: Tuple[int, int]):
-        rows, cols = len(grid), len(grid[0])
-        self._cols = cols
-        total = rows * cols
-        def idx(r: int, c: int) -> int:
-            return r * cols + c
-        start_i = idx(*start)
-        end_i = idx(*end)
-
-        def h_idx(a: int, b: int) -> int:
-            ar, ac = divmod(a, cols)
-            br, bc = divmod(b, cols)
-            return abs(ar - br) + abs(ac - bc)
-
-        g = array('i', [10**9] * total)
-        g[start_i] = 0
-        prev = array('i', [-1] * total)
-        open_heap: List[Tuple[int, int, int]] = []
-        counter = 0
-        heapq.heappush(open_heap, (h_idx(start_i, end_i), counter, start_i))
-        in_open = bytearray(total)
-        in_open[start_i] = 1
-        closed = bytearray(total)
-
-        expansions = 0
-
-        # Initial visuals
-        yield ("open_add", [start_i])
-
-        while open_heap:
-            _, _, i = heapq.heappop(open_heap)
-            if closed[i]:
-                continue  # skip entries that are outdated
-            yield ("current", i)
-
-            if i == end_i:
-                # Signal finish and pass data for path reconstruction
-                yield ("finish", (prev, cols, end_i, expansions))
-                return
-
-            closed[i] = 1
-
-            r, c = divmod(i, cols)
-            cell = grid[r][c]
-
-            # Explore 4-neighbors
-            def relax(ni: int) -> None:
-                nonlocal counter
-                tentative = g[i] + 1
-                if tentative < g[ni]:
-                    g[ni] = tentative
-                    prev[ni] = i
-                    if not in_open[ni]:
-                        counter += 1
-                        heapq.heappush(open_heap, (tentative + h_idx(ni, end_i), counter, ni))
-                        in_open[ni] = 1
-                        _open_add.append(ni)
-                # If already in open and better, we still push a new tuple;
-                # outdated tuple will be ignored when popped due to 'closed' check above.
-
-            _open_add: List[int] = []
-            if c + 1 < cols and not (cell & E):
-                relax(i + 1)
-            if c - 1 >= 0 and not (cell & W):
-                relax(i - 1)
-            if r + 1 < rows and not (cell & S):
-                relax(i + cols)
-            if r - 1 >= 0 and not (cell & N):
-                relax(i - cols)
-
-            if _open_add:
-                yield ("open_add", _open_add)
-
-            expansions += 1
-
-            # Determine if this cell is an intersection (>=3 exits)
-            exits = 0
-            if c + 1 < cols and not (cell & E):
-                exits += 1
-            if c - 1 >= 0 and not (cell & W):
-                exits += 1
-            if r + 1 < rows and not (cell & S):
-                exits += 1
-            if r - 1 >= 0 and not (cell & N):
-                exits += 1
-            if exits >= 3:
-                yield ("branch", [i])
-            else:
-                yield ("closed_add", [i])
+    def _solve_worker(self, steps, events: queue.SimpleQueue) -> None:
+        for action in steps:
+            events.put(action)
+
+    def _astar_steps(self, graph, work, cols: int, start: Tuple[int, int], end: Tuple[int, int]):
+        yield from self._solve_and_replay(astar_core, graph, work, cols, start, end)
+
+    def _astar_steps_bidir(self, graph, work, cols: int, start: Tuple[int, int], end: Tuple[int, int]):
+        yield from self._solve_and_replay(astar_bidir_core, graph, work, cols, start, end)
+
+    def _solve_and_replay(self, core, graph, work, cols: int, start: Tuple[int, int], end: Tuple[int, int]):
+        start_i = start[0] * cols + start[1]
+        end_i = end[0] * cols + end[1]
+
+        # Solve up front, then replay the recorded exploration order. The event
+        # arrays live in the shared workspace, so copy them out before releasing it.
+        with self._work_lock:
+            prev, expansions, order, kind = core(graph, work, cols, start_i, end_i)
+            order = order.tolist()
+            kind = kind.tolist()
+
+        n = len(order)
+        pos = 0
+        while pos < n:
+            k = kind[pos]
+            if k == EV_CURRENT or k == EV_CURRENT + EV_REVERSE:
+                yield (EVENT_NAMES[k], order[pos])
+                pos += 1
+                continue
+            # Group consecutive events of the same kind into one animation step
+            batch = [order[pos]]
+            pos += 1
+            while pos < n and kind[pos] == k:
+                batch.append(order[pos])
+                pos += 1
+            yield (EVENT_NAMES[k], batch)
 
-        # If we exit loop without reaching end, still finish
         yield ("finish", (prev, cols, end_i, expansions))
 
 